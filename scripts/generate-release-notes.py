@@ -2,7 +2,8 @@
 """
 This script generates release notes using the GitHub Release API then prints it to
 standard output. You must be logged into GitHub using the `gh` CLI tool or provide a
-GitHub token via `GITHUB_TOKEN` environment variable.
+GitHub token via `GITHUB_TOKEN` environment variable. If the `gh` CLI stores its token
+in its configuration file, it is read from there directly.
 
 Usage:
 
@@ -21,20 +22,48 @@ release notes for a different release. In this case, the target must be provided
 
     generate-release-notes.py "2.3.3" "main" "2.3.2"
 """
+import atexit
+import functools
+import hashlib
 import os
 import re
-import shutil
-import subprocess
 import sys
+from typing import Optional
 
-import httpx
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 REPO_ORG = "PrefectHQ"
 REPO_NAME = "prefect"
 DEFAULT_TAG = "preview"
 
-TOKEN_REGEX = re.compile(r"Token:\s(.*)")
-ENTRY_REGEX = re.compile(r"^\* (.*) by @(.*) in (.*)$", re.MULTILINE)
+TOKEN_REGEX = re.compile(r"Token:\s(.*)", re.ASCII)
+ENTRY_REGEX = re.compile(r"^\* (.*) by @(.*) in (.*)$", re.MULTILINE | re.ASCII)
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "prefect",
+    "release-notes",
+)
+
+HOST_REGEX = re.compile(r"^(\S+):\s*$", re.ASCII)
+OAUTH_TOKEN_REGEX = re.compile(r"^(\s+)oauth_token:\s*(\S+)", re.ASCII)
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """
+    Retrieve a shared client that keeps the connection to the GitHub API alive between
+    requests.
+
+    `httpx` is imported here to avoid its import cost when no request is made.
+    """
+    import httpx
+
+    client = httpx.Client(http2=True, timeout=30.0)
+    atexit.register(client.close)
+    return client
 
 
 def generate_release_notes(
@@ -52,74 +81,219 @@ def generate_release_notes(
     if previous_tag:
         request["previous_tag_name"] = previous_tag
 
-    response = httpx.post(
-        f"https://api.github.com/repos/{repo_org}/{repo_name}/releases/generate-notes",
-        headers={
-            "Accept": "application/vnd.github+json",
-            "Authorization": f"Bearer {github_token}",
-        },
-        json=request,
+    url = f"https://api.github.com/repos/{repo_org}/{repo_name}/releases/generate-notes"
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "Authorization": f"Bearer {github_token}",
+    }
+
+    # Release notes from previous runs are reused if GitHub reports they are unchanged.
+    # GitHub documents conditional requests for its REST API, but this endpoint is a
+    # POST and its documented responses do not include 304, so the cache may never be
+    # hit. Per RFC 9110, a server that evaluates `If-None-Match` on a POST responds
+    # with 412 instead of 304; both cases are handled below.
+    cache_path = os.path.join(
+        CACHE_DIR,
+        hashlib.sha256(
+            f"{repo_org}/{repo_name}|{tag_name}|{target_commit}|{previous_tag}".encode()
+        ).hexdigest(),
     )
+    cached_etag = read_cache_file(cache_path + ".etag")
+    if cached_etag:
+        headers["If-None-Match"] = cached_etag
+
+    response = get_client().post(url, headers=headers, json=request)
+    if response.status_code == 304:
+        cached_release_notes = read_cache_file(cache_path + ".md")
+        if cached_release_notes is not None:
+            print(cached_release_notes)
+            return
+
+    if cached_etag and response.status_code in (304, 412):
+        # The cached notes are missing or the precondition was rejected; request them
+        # again without the ETag
+        headers.pop("If-None-Match")
+        response = get_client().post(url, headers=headers, json=request)
+
     if not response.status_code == 200:
         print(
             "Received status code {response.status_code} from GitHub API:",
             file=sys.stderr,
         )
-        print(response.json(), file=sys.stderr)
+        print(response.text, file=sys.stderr)
         exit(1)
 
-    release_notes = response.json()["body"]
+    body = orjson.loads(response.content) if orjson else response.json()
+    release_notes = body["body"]
+
+    lines = []
+    contributors = set()
+    full_changelog = None
 
     # Drop the generated by section
-    release_notes = "\n".join(release_notes.splitlines()[2:])
+    for line in release_notes.splitlines()[2:]:
+        if line.startswith("###") and lines:
+            # Add newlines before all categories
+            lines.append("")
 
-    # Add newlines before all categories
-    release_notes = release_notes.replace("\n###", "\n\n###")
+        if line == "## What's Changed":
+            # Update what's new to release name
+            line = f"## Release {tag_name}"
 
-    # Update what's new to release name
-    release_notes = release_notes.replace("## What's Changed", f"## Release {tag_name}")
+        elif line.startswith("**Full Changelog**:") and lines:
+            # The contributors section replaces this heading and is merged into the
+            # previous line once all entries have been parsed
+            full_changelog = (len(lines) - 1, line[len("**Full Changelog**:") :])
+            continue
 
-    # Parse all entries
-    entries = ENTRY_REGEX.findall(release_notes)
+        else:
+            # Strip contributors from individual entries
+            match = ENTRY_REGEX.match(line)
+            if match:
+                title, user, pull_request = match.groups()
+                contributors.add(user)
+                line = f"- {title} — {pull_request}"
 
-    # Generate a contributors section
-    contributors = ""
-    for contributor in sorted(set(user for _, user, _ in entries)):
-        contributors += f"\n- @{contributor}"
+        lines.append(line)
 
     # Replace the heading of the existing contributors section; append contributors
-    release_notes = release_notes.replace(
-        "\n**Full Changelog**:",
-        "### Contributors" + contributors + "\n\n**All changes**:",
-    )
+    if full_changelog:
+        index, changelog_link = full_changelog
+        users = sorted(contributors)
+        lines[index] += (
+            "### Contributors"
+            + ("\n- @" + "\n- @".join(users) if users else "")
+            + "\n\n**All changes**:"
+            + changelog_link
+        )
 
-    # Strip contributors from individual entries
-    release_notes = ENTRY_REGEX.sub(
-        lambda match: f"- {match.group(1)} — {match.group(3)}",
-        release_notes,
-    )
+    release_notes = "\n".join(lines)
+
+    etag = response.headers.get("ETag")
+    if etag:
+        write_cache_file(cache_path + ".md", release_notes)
+        write_cache_file(cache_path + ".etag", etag)
 
     print(release_notes)
 
 
+def read_cache_file(path: str) -> Optional[str]:
+    """
+    Read a file from the release notes cache, returning `None` if it cannot be read.
+    """
+    try:
+        with open(path) as cache_file:
+            return cache_file.read()
+    except OSError:
+        return None
+
+
+def write_cache_file(path: str, contents: str) -> None:
+    """
+    Write a file to the release notes cache. Failures are ignored.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as cache_file:
+            cache_file.write(contents)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_gh_path() -> Optional[str]:
+    """
+    Retrieve the path to the `gh` CLI, if installed.
+    """
+    import shutil
+
+    return shutil.which("gh")
+
+
+def get_gh_config_token(host: str = "github.com") -> Optional[str]:
+    """
+    Retrieve the GitHub token stored in the `gh` CLI configuration file, if any.
+
+    Only the host-level `oauth_token` belongs to the active account. Since gh 2.40,
+    every logged in account is also listed under the host's `users` key; tokens nested
+    there are ignored.
+
+    Newer versions of the `gh` CLI may store the token in the system keyring instead,
+    in which case `None` is returned and the caller falls back to `gh auth status`.
+    """
+    config_dir = os.environ.get("GH_CONFIG_DIR")
+    if not config_dir:
+        config_dir = os.path.join(
+            os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config")), "gh"
+        )
+
+    try:
+        with open(os.path.join(config_dir, "hosts.yml")) as hosts_file:
+            current_host = None
+            host_key_indent = None
+            for line in hosts_file:
+                match = HOST_REGEX.match(line)
+                if match:
+                    current_host = match.group(1)
+                    host_key_indent = None
+                    continue
+
+                if current_host != host or not line.strip():
+                    continue
+
+                # The first key under the host sets the indentation of its direct
+                # children; deeper keys belong to nested mappings such as `users`
+                indent = len(line) - len(line.lstrip())
+                if host_key_indent is None:
+                    host_key_indent = indent
+
+                match = OAUTH_TOKEN_REGEX.match(line)
+                if match and len(match.group(1)) == host_key_indent:
+                    return match.group(2)
+    except OSError:
+        pass
+
+    return None
+
+
 def get_github_token() -> str:
     """
-    Retrieve the current GitHub token from the `gh` CLI.
+    Retrieve the current GitHub token from the environment or the `gh` CLI.
     """
+    import subprocess
+
     if "GITHUB_TOKEN" in os.environ:
         return os.environ["GITHUB_TOKEN"]
 
-    if not shutil.which("gh"):
+    # Avoid calling out to the `gh` CLI if the token can be read from its config
+    token = get_gh_config_token()
+    if token:
+        return token
+
+    if not get_gh_path():
         print(
             "You must provide a GitHub access token via GITHUB_TOKEN or have the gh CLI"
             " installed."
         )
         exit(1)
 
-    gh_auth_status = subprocess.run(
-        ["gh", "auth", "status", "--show-token"], capture_output=True
+    # Read the output line-by-line and stop as soon as the token is found
+    gh_auth_status = subprocess.Popen(
+        ["gh", "auth", "status", "--show-token"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
     )
-    output = gh_auth_status.stderr.decode()
+    output = []
+    with gh_auth_status:
+        for line in gh_auth_status.stderr:
+            match = TOKEN_REGEX.search(line)
+            if match:
+                gh_auth_status.terminate()
+                return match.groups()[0]
+            output.append(line)
+
+    output = "".join(output)
     if not gh_auth_status.returncode == 0:
         print(
             "Failed to retrieve authentication status from GitHub CLI:", file=sys.stderr
@@ -127,19 +301,15 @@ def get_github_token() -> str:
         print(output, file=sys.stderr)
         exit(1)
 
-    match = TOKEN_REGEX.search(output)
-    if not match:
-        print(
-            (
-                "Failed to find token in GitHub CLI output with regex"
-                f" {TOKEN_REGEX.pattern!r}:"
-            ),
-            file=sys.stderr,
-        )
-        print(output, file=sys.stderr)
-        exit(1)
-
-    return match.groups()[0]
+    print(
+        (
+            "Failed to find token in GitHub CLI output with regex"
+            f" {TOKEN_REGEX.pattern!r}:"
+        ),
+        file=sys.stderr,
+    )
+    print(output, file=sys.stderr)
+    exit(1)
 
 
 if __name__ == "__main__":
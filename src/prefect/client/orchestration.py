@@ -6,6 +6,7 @@ from uuid import UUID
 
 import httpcore
 import httpx
+import orjson
 import pendulum
 import pydantic
 from asgi_lifespan import LifespanManager
@@ -1925,7 +1926,13 @@ class PrefectClient:
             log.dict(json_compatible=True) if isinstance(log, LogCreate) else log
             for log in logs
         ]
-        await self._client.post(f"/logs/", json=serialized_logs)
+        # Serialize the whole batch at once with `orjson` instead of the standard
+        # library encoder used for `json` request content
+        await self._client.post(
+            f"/logs/",
+            content=orjson.dumps(serialized_logs),
+            headers={"Content-Type": "application/json"},
+        )
 
     async def create_flow_run_notification_policy(
         self,
@@ -202,6 +202,9 @@ class RunContext(ContextModel):
     start_time: DateTimeTZ = Field(default_factory=lambda: pendulum.now("UTC"))
     client: PrefectClient
 
+    # The run, run name, and logger from the last `get_run_logger` call for this run
+    _run_logger: Tuple[Any, Any, Any] = PrivateAttr((None, None, None))
+
 
 class FlowRunContext(RunContext):
     """
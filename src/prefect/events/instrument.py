@@ -118,6 +118,11 @@ def instrument_method_calls_on_class_instances(cls: Type) -> Type:
                 ... this method will not ...
     """
 
+    # Classes are instrumented in place, so repeated calls (e.g. each time a block is
+    # loaded) do not need to walk the class attributes again
+    if cls.__dict__.get("__events_instrumented__", False):
+        return cls
+
     required_events_methods = ["_event_kind", "_event_method_called_resources"]
     for method in required_events_methods:
         if not hasattr(cls, method):
@@ -132,4 +137,6 @@ def instrument_method_calls_on_class_instances(cls: Type) -> Type:
         exclude_methods=getattr(cls, "_events_excluded_methods", []),
     ):
         setattr(cls, name, decorator(method))
+
+    setattr(cls, "__events_instrumented__", True)
     return cls
@@ -1,15 +1,22 @@
+import copy
 import logging
 import logging.config
 import os
 import re
 import string
 import warnings
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+try:
+    # Use the libyaml bindings when available as they are much faster to parse with
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from prefect.settings import (
     PREFECT_LOGGING_EXTRA_LOGGERS,
     PREFECT_LOGGING_SETTINGS_PATH,
@@ -27,6 +34,17 @@ PROCESS_LOGGING_CONFIG: dict = None
 to_envvar = partial(re.sub, re.compile(r"[^0-9a-zA-Z]+"), "_")
 
 
+@lru_cache(maxsize=8)
+def _parse_logging_config(text: str) -> dict:
+    """
+    Parses a logging configuration YAML document.
+
+    Results are cached by the document text, callers must not mutate the returned
+    configuration.
+    """
+    return yaml.load(text, Loader=SafeLoader)
+
+
 def load_logging_config(path: Path) -> dict:
     """
     Loads logging configuration from a path allowing override from the environment
@@ -34,14 +52,16 @@ def load_logging_config(path: Path) -> dict:
     template = string.Template(path.read_text())
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=DeprecationWarning)
-        config = yaml.safe_load(
-            # Substitute settings into the template in format $SETTING / ${SETTING}
-            template.substitute(
-                {
-                    setting.name: str(setting.value())
-                    for setting in SETTING_VARIABLES.values()
-                    if setting.value() is not None
-                }
+        config = copy.deepcopy(
+            _parse_logging_config(
+                # Substitute settings into the template in format $SETTING / ${SETTING}
+                template.substitute(
+                    {
+                        setting.name: str(setting.value())
+                        for setting in SETTING_VARIABLES.values()
+                        if setting.value() is not None
+                    }
+                )
             )
         )
 
@@ -1,10 +1,12 @@
 import logging.handlers
 import sys
 import traceback
+from functools import partial
 from types import TracebackType
 from typing import Optional, Tuple, Type, Union
 
 import orjson
+from pydantic.json import pydantic_encoder
 
 from prefect.serializers import JSONSerializer
 
@@ -46,12 +48,17 @@ class JsonFormatter(logging.Formatter):
         if fmt not in ["pretty", "default"]:
             raise ValueError("Format must be either 'pretty' or 'default'.")
 
+        dumps_kwargs = {"option": orjson.OPT_INDENT_2} if fmt == "pretty" else {}
         self.serializer = JSONSerializer(
             jsonlib="orjson",
             object_encoder="pydantic.json.pydantic_encoder",
-            dumps_kwargs={"option": orjson.OPT_INDENT_2} if fmt == "pretty" else {},
+            dumps_kwargs=dumps_kwargs,
         )
 
+        # `JSONSerializer.dumps` imports the JSON library and object encoder by name on
+        # every call; bind them once instead since this runs for every record
+        self._dumps = partial(orjson.dumps, default=pydantic_encoder, **dumps_kwargs)
+
     def format(self, record: logging.LogRecord) -> str:
         record_dict = record.__dict__.copy()
 
@@ -60,9 +67,9 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             record_dict["exc_info"] = format_exception_info(record.exc_info)
 
-        log_json_bytes = self.serializer.dumps(record_dict)
+        log_json_bytes = self._dumps(record_dict)
 
-        # JSONSerializer returns bytes; decode to string to conform to
+        # orjson returns bytes; decode to string to conform to
         # the `logging.Formatter.format` interface
         return log_json_bytes.decode()
 
@@ -1,16 +1,18 @@
 import atexit
+import collections
 import json
 import logging
-import queue
 import sys
 import threading
 import time
 import traceback
+import uuid
 import warnings
-from typing import Any, Dict, List, Tuple, Union
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Tuple, Union
 
 import anyio
-import pendulum
 from rich.console import Console
 from rich.highlighter import Highlighter, NullHighlighter
 from rich.theme import Theme
@@ -20,7 +22,6 @@ from prefect._internal.compatibility.deprecated import deprecated_callable
 from prefect.client.orchestration import get_client
 from prefect.exceptions import MissingContextError
 from prefect.logging.highlighters import PrefectConsoleHighlighter
-from prefect.server.schemas.actions import LogCreate
 from prefect.settings import (
     PREFECT_LOGGING_COLORS,
     PREFECT_LOGGING_MARKUP,
@@ -32,6 +33,15 @@ from prefect.settings import (
 )
 
 
+def _uuid_to_str(value: Union[uuid.UUID, str]) -> str:
+    """
+    Serialize a run id, raising a `ValueError` if it is not a valid UUID.
+    """
+    if not isinstance(value, uuid.UUID):
+        value = uuid.UUID(str(value))
+    return str(value)
+
+
 class APILogWorker:
     """
     Manages the submission of logs to the API in a background thread.
@@ -40,7 +50,9 @@ class APILogWorker:
     def __init__(self, profile_context: prefect.context.SettingsContext) -> None:
         self.profile_context = profile_context.copy()
 
-        self._queue: queue.Queue[Tuple[Dict[str, Any], int]] = queue.Queue()
+        # Appends and pops on a deque are thread-safe, there is a single consumer and
+        # wake-ups are driven by the flush and stop events so no condition is needed
+        self._queue: Deque[Tuple[Dict[str, Any], int]] = collections.deque()
 
         self._send_thread = threading.Thread(
             target=self._send_logs_loop,
@@ -59,6 +71,15 @@ class APILogWorker:
         self._pending_size: int = 0
         self._retries = 0
         self._max_retries = 3
+        self._max_concurrent_batches = 4
+
+        # Tracks the approximate size of logs enqueued since the last send so the
+        # worker can be woken early once a full batch is waiting. Updates may race
+        # but the count is reset on every send so any drift is short-lived.
+        self._enqueued_size: int = 0
+        self._batch_size = PREFECT_LOGGING_TO_API_BATCH_SIZE.value_from(
+            self.profile_context.settings
+        )
 
         # Ensure stop is called at exit
         if sys.version_info < (3, 9):
@@ -88,8 +109,11 @@ class APILogWorker:
                         PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()
                     )
                     self._flush_event.clear()
+                    self._enqueued_size = 0
 
-                    anyio.run(self.send_logs)
+                    # Avoid starting an event loop when there is nothing to send
+                    if self._queue or self._pending_logs:
+                        anyio.run(self.send_logs)
 
                     # Notify watchers that logs were sent
                     self._send_logs_finished_event.set()
@@ -115,8 +139,8 @@ class APILogWorker:
         """
         Send all logs in the queue in batches to avoid network limits.
 
-        If a client error is encountered, the logs pulled from the queue are retained
-        and will be sent on the next call.
+        Multiple batches are sent concurrently. If a client error is encountered, the
+        logs pulled from the queue are retained and will be sent on the next call.
 
         Note that if there is a single bad log in the queue, this will repeatedly
         fail as we do not ever drop logs. We may want to adjust this behavior in the
@@ -133,67 +157,118 @@ class APILogWorker:
             PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value(),
         )
 
-        # Loop until the queue is empty or we encounter an error
-        while not done:
-            # Pull logs from the queue until it is empty or we reach the batch size
-            try:
-                while self._pending_size < max_batch_size:
-                    log, log_size = self._queue.get_nowait()
-                    self._pending_logs.append(log)
-                    self._pending_size += log_size
+        # Loop until the queue is empty or we encounter an error. A single client is
+        # shared by all of the batches sent during this call.
+        async with AsyncExitStack() as stack:
+            client = None
+
+            while not done:
+                # Pull logs from the queue until it is empty or we reach the batch size
+                # for the first batch, which includes any logs that previously failed,
+                # then pull additional batches to send concurrently
+                extra_batches: List[List[Tuple[Dict[str, Any], int]]] = []
+                try:
+                    while self._pending_size < max_batch_size:
+                        log, log_size = self._queue.popleft()
+                        self._pending_logs.append(log)
+                        self._pending_size += log_size
+
+                    while len(extra_batches) < self._max_concurrent_batches - 1:
+                        batch = []
+                        batch_size = 0
+                        extra_batches.append(batch)
+                        while batch_size < max_batch_size:
+                            log, log_size = self._queue.popleft()
+                            batch.append((log, log_size))
+                            batch_size += log_size
+
+                except IndexError:
+                    done = True
+
+                if extra_batches and not extra_batches[-1]:
+                    extra_batches.pop()
+
+                if not self._pending_logs:
+                    continue
+
+                if client is None:
+                    client = get_client()
+                    client.manage_lifespan = False
+                    await stack.enter_async_context(client)
 
-            except queue.Empty:
+                batches = [self._pending_logs] + [
+                    [log for log, _ in batch] for batch in extra_batches
+                ]
+                errors = [None] * len(batches)
+
+                async def send_batch(index: int) -> None:
+                    try:
+                        await client.create_logs(batches[index])
+                    except Exception:
+                        errors[index] = sys.exc_info()
+
+                async with anyio.create_task_group() as tg:
+                    for index in range(len(batches)):
+                        tg.start_soon(send_batch, index)
+
+                failed = [index for index, error in enumerate(errors) if error]
+                if not failed:
+                    self._pending_logs = []
+                    self._pending_size = 0
+                    self._retries = 0
+                    continue
+
+                # Attempt to send these logs on the next call instead. The first failed
+                # batch is retained as pending and the logs of any later failed batches
+                # are returned to the front of the queue so they are sent in order.
                 done = True
 
-            if not self._pending_logs:
-                continue
+                first_failed, *later_failed = failed
+                for index in reversed(later_failed):
+                    self._queue.extendleft(reversed(extra_batches[index - 1]))
+                if first_failed > 0:
+                    # The previously pending logs were sent; the retry count belongs
+                    # to the batch that replaces them
+                    batch = extra_batches[first_failed - 1]
+                    self._pending_logs = [log for log, _ in batch]
+                    self._pending_size = sum(log_size for _, log_size in batch)
+                    self._retries = 0
 
-            client = get_client()
-            client.manage_lifespan = False
-            async with client:
-                try:
-                    await client.create_logs(self._pending_logs)
+                self._retries += 1
+
+                # Roughly replicate the behavior of the stdlib logger error handling
+                if logging.raiseExceptions and sys.stderr:
+                    sys.stderr.write("--- Error logging to API ---\n")
+                    traceback.print_exception(*errors[first_failed], file=sys.stderr)
+                    sys.stderr.write(self.worker_info())
+                    if exiting:
+                        sys.stderr.write(
+                            "The log worker is stopping and these logs will not be"
+                            " sent.\n"
+                        )
+                    elif self._retries > self._max_retries:
+                        sys.stderr.write(
+                            "The log worker has tried to send these logs "
+                            f"{self._retries} times and will now drop them."
+                        )
+                    else:
+                        sys.stderr.write(
+                            "The log worker will attempt to send these logs"
+                            " again in "
+                            f"{PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()}s\n"
+                        )
+
+                if self._retries > self._max_retries:
+                    # Drop this batch of logs
                     self._pending_logs = []
                     self._pending_size = 0
                     self._retries = 0
-                except Exception:
-                    # Attempt to send these logs on the next call instead
-                    done = True
-                    self._retries += 1
-
-                    # Roughly replicate the behavior of the stdlib logger error handling
-                    if logging.raiseExceptions and sys.stderr:
-                        sys.stderr.write("--- Error logging to API ---\n")
-                        traceback.print_exc(file=sys.stderr)
-                        sys.stderr.write(self.worker_info())
-                        if exiting:
-                            sys.stderr.write(
-                                "The log worker is stopping and these logs will not be"
-                                " sent.\n"
-                            )
-                        elif self._retries > self._max_retries:
-                            sys.stderr.write(
-                                "The log worker has tried to send these logs "
-                                f"{self._retries} times and will now drop them."
-                            )
-                        else:
-                            sys.stderr.write(
-                                "The log worker will attempt to send these logs"
-                                " again in "
-                                f"{PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()}s\n"
-                            )
-
-                    if self._retries > self._max_retries:
-                        # Drop this batch of logs
-                        self._pending_logs = []
-                        self._pending_size = 0
-                        self._retries = 0
 
     def worker_info(self) -> str:
         """Returns a debugging string with worker log stats"""
         return (
             "Worker information:\n"
-            f"    Approximate queue length: {self._queue.qsize()}\n"
+            f"    Approximate queue length: {len(self._queue)}\n"
             f"    Pending log batch length: {len(self._pending_logs)}\n"
             f"    Pending log batch size: {self._pending_size}\n"
         )
@@ -203,7 +278,13 @@ class APILogWorker:
             raise RuntimeError(
                 "Logs cannot be enqueued after the API log worker is stopped."
             )
-        self._queue.put((log, log_size))
+        self._queue.append((log, log_size))
+
+        # Send logs immediately instead of waiting for the batch interval once a full
+        # batch is waiting. Failed logs are only retried after the batch interval.
+        self._enqueued_size += log_size
+        if self._enqueued_size >= self._batch_size and not self._pending_logs:
+            self._flush_event.set()
 
     def flush(self, block: bool = False) -> None:
         with self._lock:
@@ -255,12 +336,23 @@ class APILogHandler(logging.Handler):
 
     workers: Dict[prefect.context.SettingsContext, APILogWorker] = {}
 
+    # The workers mapping, settings context, and worker of the last lookup
+    _last_worker: Tuple[Any, Any, Any] = (None, None, None)
+
     def get_worker(self, context: prefect.context.SettingsContext) -> APILogWorker:
-        if context not in self.workers:
+        # Consecutive records are usually emitted from the same settings context; check
+        # it by identity before hashing every setting to look up its worker
+        workers, last_context, worker = self._last_worker
+        if workers is self.workers and last_context is context:
+            return worker
+
+        worker = self.workers.get(context)
+        if worker is None:
             worker = self.workers[context] = APILogWorker(context)
             worker.start()
 
-        return self.workers[context]
+        type(self)._last_worker = (self.workers, context, worker)
+        return worker
 
     @classmethod
     def flush(cls, block: bool = False):
@@ -272,6 +364,17 @@ class APILogHandler(logging.Handler):
         for worker in cls.workers.values():
             worker.flush(block)
 
+    def filter(self, record: logging.LogRecord):
+        """
+        Drop records that have opted out of being sent to the API.
+
+        Filters are checked before the handler lock is acquired, so opted out records
+        do no further work.
+        """
+        if not record.__dict__.get("send_to_orion", True):
+            return False
+        return super().filter(record)
+
     def emit(self, record: logging.LogRecord):
         """
         Send a log to the `APILogWorker`
@@ -281,8 +384,6 @@ class APILogHandler(logging.Handler):
 
             if not PREFECT_LOGGING_TO_API_ENABLED.value_from(profile.settings):
                 return  # Respect the global settings toggle
-            if not getattr(record, "send_to_orion", True):
-                return  # Do not send records that have opted out
 
             log, log_size = self.prepare(record, profile.settings)
             self.get_worker(profile).enqueue(log, log_size)
@@ -322,8 +423,10 @@ class APILogHandler(logging.Handler):
 
         Logs exceeding the maximum size will be dropped.
         """
-        flow_run_id = getattr(record, "flow_run_id", None)
-        task_run_id = getattr(record, "task_run_id", None)
+        # Extra fields are stored in the record's instance dictionary
+        record_attrs = record.__dict__
+        flow_run_id = record_attrs.get("flow_run_id")
+        task_run_id = record_attrs.get("task_run_id")
 
         if not flow_run_id:
             try:
@@ -346,19 +449,20 @@ class APILogHandler(logging.Handler):
                     "run information."
                 )
 
-        # Parsing to a `LogCreate` object here gives us nice parsing error messages
-        # from the standard lib `handleError` method if something goes wrong and
-        # prevents malformed logs from entering the queue
-        log = LogCreate(
-            flow_run_id=flow_run_id,
-            task_run_id=task_run_id,
-            name=record.name,
-            level=record.levelno,
-            timestamp=pendulum.from_timestamp(
-                getattr(record, "created", None) or time.time()
-            ),
-            message=self.format(record),
-        ).dict(json_compatible=True)
+        # Build the JSON compatible `LogCreate` payload directly rather than through
+        # the model to avoid validation and serialization overhead for every record.
+        # Run ids are still parsed so malformed logs raise from the standard lib
+        # `handleError` method instead of entering the queue.
+        log = {
+            "name": record.name,
+            "level": record.levelno,
+            "message": self.format(record),
+            "timestamp": datetime.fromtimestamp(
+                record_attrs.get("created") or time.time(), tz=timezone.utc
+            ).isoformat(),
+            "flow_run_id": _uuid_to_str(flow_run_id),
+            "task_run_id": _uuid_to_str(task_run_id) if task_run_id else None,
+        }
 
         log_size = self.get_log_size(log)
         if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
@@ -380,7 +484,10 @@ class APILogHandler(logging.Handler):
         return super().close()
 
     def get_log_size(self, log: Dict[str, Any]) -> int:
-        return len(json.dumps(log).encode())
+        # The API client sends compact UTF-8 JSON encoded by `orjson`. The stdlib
+        # encoding escapes non-ASCII characters and adds spaces after separators, so
+        # its length is an upper bound on the size of the payload in bytes.
+        return len(json.dumps(log))
 
 
 class PrefectConsoleHandler(logging.StreamHandler):
@@ -411,7 +518,10 @@ class PrefectConsoleHandler(logging.StreamHandler):
             highlighter = NullHighlighter()
             theme = Theme(inherit=False)
 
-        self.level = level
+        # Without styles or markup there is nothing for rich to render
+        self._plain = not styled_console and not markup_console
+
+        self.setLevel(level)
         self.console = Console(
             highlighter=highlighter,
             theme=theme,
@@ -420,6 +530,9 @@ class PrefectConsoleHandler(logging.StreamHandler):
         )
 
     def emit(self, record: logging.LogRecord):
+        if self._plain:
+            return super().emit(record)
+
         try:
             message = self.format(record)
             self.console.print(message, soft_wrap=True)
@@ -1,3 +1,5 @@
+import re
+
 from rich.highlighter import RegexHighlighter
 
 from prefect.states import StateType
@@ -54,9 +56,14 @@ class PrefectConsoleHighlighter(RegexHighlighter):
     """Applies style from multiple highlighters."""
 
     base_style = "log."
-    highlights = (
-        LevelHighlighter.highlights
-        + UrlHighlighter.highlights
-        + NameHighlighter.highlights
-        + StateHighlighter.highlights
-    )
+    # Patterns are compiled once rather than looked up in the `re` cache for each
+    # pattern of every highlighted message
+    highlights = [
+        re.compile(pattern)
+        for pattern in (
+            LevelHighlighter.highlights
+            + UrlHighlighter.highlights
+            + NameHighlighter.highlights
+            + StateHighlighter.highlights
+        )
+    ]
@@ -26,7 +26,10 @@ class PrefectLogAdapter(logging.LoggerAdapter):
     """
 
     def process(self, msg, kwargs):
-        kwargs["extra"] = {**self.extra, **(kwargs.get("extra") or {})}
+        # The extra data is only read when the record is made, so the adapter's data
+        # can be passed as-is unless it needs to be merged with the call's data
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
         return (msg, kwargs)
 
 
@@ -80,6 +83,21 @@ def get_run_logger(
     task_run_context = prefect.context.TaskRunContext.get()
     flow_run_context = prefect.context.FlowRunContext.get()
 
+    # Without overrides, reuse the logger from the last call for the current run as
+    # long as the run has not been replaced or renamed since
+    run_context = None
+    if context is None and not kwargs:
+        run_context = task_run_context or flow_run_context
+        if run_context is not None:
+            run = (
+                task_run_context.task_run
+                if task_run_context
+                else flow_run_context.flow_run
+            )
+            cached_run, cached_run_name, logger = run_context._run_logger
+            if cached_run is run and cached_run_name == run.name:
+                return logger
+
     # Apply the context override
     if context:
         if isinstance(context, prefect.context.FlowRunContext):
@@ -113,6 +131,9 @@ def get_run_logger(
     else:
         raise MissingContextError("There is no active flow or task run context.")
 
+    if run_context is not None:
+        run_context._run_logger = (run, run.name, logger)
+
     return logger
 
 
@@ -128,11 +149,9 @@ def flow_run_logger(flow_run: "FlowRun", flow: "Flow" = None, **kwargs: str):
     return PrefectLogAdapter(
         get_logger("prefect.flow_runs"),
         extra={
-            **{
-                "flow_run_name": flow_run.name,
-                "flow_run_id": str(flow_run.id),
-                "flow_name": flow.name if flow else "<unknown>",
-            },
+            "flow_run_name": flow_run.name,
+            "flow_run_id": str(flow_run.id),
+            "flow_name": flow.name if flow else "<unknown>",
             **kwargs,
         },
     )
@@ -156,14 +175,12 @@ def task_run_logger(
     return PrefectLogAdapter(
         get_logger("prefect.task_runs"),
         extra={
-            **{
-                "task_run_id": str(task_run.id),
-                "flow_run_id": str(task_run.flow_run_id),
-                "task_run_name": task_run.name,
-                "task_name": task.name if task else "<unknown>",
-                "flow_run_name": flow_run.name if flow_run else "<unknown>",
-                "flow_name": flow.name if flow else "<unknown>",
-            },
+            "task_run_id": str(task_run.id),
+            "flow_run_id": str(task_run.flow_run_id),
+            "task_run_name": task_run.name,
+            "task_name": task.name if task else "<unknown>",
+            "flow_run_name": flow_run.name if flow_run else "<unknown>",
+            "flow_name": flow.name if flow else "<unknown>",
             **kwargs,
         },
     )
@@ -206,10 +223,10 @@ def print_as_log(*args, **kwargs):
 
     If no run is active, `print` will behave as if it were not patched.
     """
-    from prefect.context import FlowRunContext, TaskRunContext
-
-    context = TaskRunContext.get() or FlowRunContext.get()
-    if not context or not context.log_prints:
+    context = (
+        prefect.context.TaskRunContext.get() or prefect.context.FlowRunContext.get()
+    )
+    if context is None or not context.log_prints:
         return print(*args, **kwargs)
 
     logger = get_run_logger()
@@ -403,7 +403,7 @@ def create_app(
             await db.create_db()
 
     @_memoize_block_auto_registration
-    async def add_block_types():
+    async def register_block_types():
         """Add all registered blocks to the database"""
         if not prefect.settings.PREFECT_API_BLOCKS_REGISTER_ON_START:
             return
@@ -414,9 +414,17 @@ def create_app(
         db = provide_database_interface()
         session = await db.session()
 
+        async with session:
+            await run_block_auto_registration(session=session)
+
+    async def add_block_types():
+        """
+        Add all registered blocks to the database, logging any errors. Errors are
+        handled outside of the memoized registration so that a failed registration is
+        not recorded in the memo store and is retried on the next start.
+        """
         try:
-            async with session:
-                await run_block_auto_registration(session=session)
+            await register_block_types()
         except Exception as exc:
             logger.warn(f"Error occurred during block auto-registration: {exc!r}")
 
@@ -17,15 +17,16 @@ COLLECTIONS_BLOCKS_DATA_PATH = (
 async def _install_protected_system_blocks(session):
     """Install block types that the system expects to be present"""
 
-    for block in [
-        prefect.blocks.webhook.Webhook,
-        prefect.blocks.system.JSON,
-        prefect.blocks.system.DateTime,
-        prefect.blocks.system.Secret,
-        prefect.filesystems.LocalFileSystem,
-        prefect.infrastructure.Process,
-    ]:
-        async with session.begin():
+    # all system blocks are installed in a single transaction
+    async with session.begin():
+        for block in [
+            prefect.blocks.webhook.Webhook,
+            prefect.blocks.system.JSON,
+            prefect.blocks.system.DateTime,
+            prefect.blocks.system.Secret,
+            prefect.filesystems.LocalFileSystem,
+            prefect.infrastructure.Process,
+        ]:
             block_type = block._to_block_type()
             block_type.is_protected = True
 
@@ -132,9 +133,10 @@ async def _register_registry_blocks(session: sa.orm.Session):
 
     block_registry = get_registry_for_type(Block) or {}
 
-    for block_class in block_registry.values():
-        # each block schema gets its own transaction
-        async with session.begin():
+    # all block schemas are registered in a single transaction to avoid a commit
+    # per block type
+    async with session.begin():
+        for block_class in block_registry.values():
             block_type_id = await register_block_type(
                 session=session,
                 block_type=block_class._to_block_type(),
@@ -154,9 +156,10 @@ async def _register_collection_blocks(session: sa.orm.Session):
         for collection in collections_blocks_data["collections"].values()
         for block_type in collection["block_types"].values()
     ]
-    for block_type in block_types:
-        # each block schema gets its own transaction
-        async with session.begin():
+    # all block schemas are registered in a single transaction to avoid a commit
+    # per block type
+    async with session.begin():
+        for block_type in block_types:
             block_schemas = block_type.pop("block_schemas", [])
             block_type_id = await register_block_type(
                 session=session,
@@ -35,13 +35,14 @@ def get_registry_for_type(cls: T) -> Optional[Dict[str, T]]:
 
     If not found, `None` is returned.
     """
-    return next(
-        filter(
-            lambda registry: registry is not None,
-            (_TYPE_REGISTRIES.get(cls) for cls in cls.mro()),
-        ),
-        None,
-    )
+    # Bind the lookup locally to avoid a global lookup for each base class
+    get_registry = _TYPE_REGISTRIES.get
+    for base in cls.__mro__:
+        registry = get_registry(base)
+        if registry is not None:
+            return registry
+
+    return None
 
 
 def get_dispatch_key(
@@ -309,6 +309,20 @@ class TestMemoizeBlockAutoRegistration:
             == current_block_registry_hash
         ), "Key was not updated in memo store"
 
+    async def test_does_not_write_key_when_wrapped_function_fails(
+        self, current_block_registry_hash
+    ):
+        test_func = AsyncMock(side_effect=ValueError("registration failed"))
+
+        with patch("prefect.server.api.server.hash_objects") as mock:
+            mock.return_value = current_block_registry_hash
+            with pytest.raises(ValueError, match="registration failed"):
+                await _memoize_block_auto_registration(test_func)()
+
+        test_func.assert_called_once()
+
+        assert not PREFECT_MEMO_STORE_PATH.value().exists()
+
     async def test_runs_wrapped_function_when_memoization_disabled(
         self, memo_store_with_accurate_key
     ):
@@ -1,7 +1,6 @@
 import asyncio
 import json
 import logging
-import queue
 import sys
 import threading
 import time
@@ -35,6 +34,7 @@ from prefect.logging.formatters import JsonFormatter
 from prefect.logging.handlers import APILogHandler, APILogWorker, PrefectConsoleHandler
 from prefect.logging.highlighters import PrefectConsoleHighlighter
 from prefect.logging.loggers import (
+    PrefectLogAdapter,
     disable_logger,
     disable_run_logger,
     flow_run_logger,
@@ -124,6 +124,18 @@ def test_setup_logging_sets_incremental_on_repeated_calls(dictConfigMock):
     assert dictConfigMock.mock_calls[1][1][0]["incremental"] == True
 
 
+def test_setup_logging_restores_levels_changed_at_runtime():
+    logger = logging.getLogger("prefect")
+    configured_level = logger.level
+    setup_logging()
+    try:
+        logger.setLevel(logging.CRITICAL)
+        setup_logging()
+        assert logger.level == configured_level
+    finally:
+        logger.setLevel(configured_level)
+
+
 def test_setup_logging_uses_settings_path_if_exists(tmp_path, dictConfigMock):
     config_file = tmp_path.joinpath("exists.yaml")
     config_file.write_text("foo: bar")
@@ -177,6 +189,16 @@ def test_setup_logging_uses_env_var_overrides(tmp_path, dictConfigMock, monkeypa
     dictConfigMock.assert_called_once_with(expected_config)
 
 
+def test_load_logging_config_returns_independent_copies():
+    config = load_logging_config(DEFAULT_LOGGING_SETTINGS_PATH)
+    config["loggers"]["prefect"]["level"] = "MUTATED"
+    config["loggers"]["prefect.flow_runs"]["handlers"].append("MUTATED")
+
+    fresh_config = load_logging_config(DEFAULT_LOGGING_SETTINGS_PATH)
+    assert fresh_config["loggers"]["prefect"]["level"] != "MUTATED"
+    assert "MUTATED" not in fresh_config["loggers"]["prefect.flow_runs"]["handlers"]
+
+
 @pytest.mark.skip(reason="Will address with other infra compatibility improvements.")
 @pytest.mark.enable_api_log_handler
 async def test_flow_run_respects_extra_loggers(orion_client, logger_test_deployment):
@@ -255,6 +277,23 @@ def mock_log_worker(monkeypatch):
     return mock
 
 
+@pytest.fixture(scope="session")
+def expected_log():
+    """
+    Builds the payload the API log handler is expected to send for a log.
+
+    The payload is serialized through the `LogCreate` schema to check that the
+    handler's payload matches the API's. The timestamp is tested separately.
+    """
+
+    def expected_log(**fields):
+        log = LogCreate.construct(**fields).dict(json_compatible=True)
+        log["timestamp"] = ANY
+        return log
+
+    return expected_log
+
+
 @pytest.mark.enable_api_log_handler
 class TestAPILogHandler:
     @pytest.fixture
@@ -269,6 +308,21 @@ class TestAPILogHandler:
         yield logger
         logger.removeHandler(handler)
 
+    @pytest.fixture
+    def emitted_records(self, handler, monkeypatch):
+        """
+        Captures records emitted by the handler without the overhead of a mock.
+        """
+        records = []
+        emit = handler.emit
+
+        def capture(record):
+            records.append(record)
+            return emit(record)
+
+        monkeypatch.setattr(handler, "emit", capture)
+        return records
+
     def test_handler_instances_share_log_worker(self):
         first = APILogHandler().get_worker(prefect.context.get_settings_context())
         second = APILogHandler().get_worker(prefect.context.get_settings_context())
@@ -283,6 +337,14 @@ class TestAPILogHandler:
         assert a is not b
         assert len(APILogHandler.workers) == 2
 
+    def test_log_workers_are_not_reused_after_reset(self):
+        a = APILogHandler().get_worker(prefect.context.get_settings_context())
+        APILogHandler.flush()
+        APILogHandler.workers = {}
+        b = APILogHandler().get_worker(prefect.context.get_settings_context())
+        assert a is not b
+        assert APILogHandler.workers == {prefect.context.get_settings_context(): b}
+
     def test_instantiates_log_worker(self, mock_log_worker):
         APILogHandler().get_worker(prefect.context.get_settings_context())
         mock_log_worker.assert_called_once_with(prefect.context.get_settings_context())
@@ -340,41 +402,43 @@ class TestAPILogHandler:
         APILogHandler().close()
         mock_log_worker().stop.assert_not_called()
 
-    def test_sends_task_run_log_to_worker(self, logger, mock_log_worker, task_run):
+    def test_sends_task_run_log_to_worker(
+        self, logger, mock_log_worker, task_run, expected_log
+    ):
         with TaskRunContext.construct(task_run=task_run):
             logger.info("test-task")
 
-        expected = LogCreate.construct(
+        expected = expected_log(
             flow_run_id=task_run.flow_run_id,
             task_run_id=task_run.id,
             name=logger.name,
             level=logging.INFO,
             message="test-task",
-        ).dict(json_compatible=True)
-        expected["timestamp"] = ANY  # Tested separately
+        )
         log_size = ANY  # Tested separately
 
         mock_log_worker().enqueue.assert_called_once_with(expected, log_size)
 
-    def test_sends_flow_run_log_to_worker(self, logger, mock_log_worker, flow_run):
+    def test_sends_flow_run_log_to_worker(
+        self, logger, mock_log_worker, flow_run, expected_log
+    ):
         with FlowRunContext.construct(flow_run=flow_run):
             logger.info("test-flow")
 
-        expected = LogCreate.construct(
+        expected = expected_log(
             flow_run_id=flow_run.id,
             task_run_id=None,
             name=logger.name,
             level=logging.INFO,
             message="test-flow",
-        ).dict(json_compatible=True)
-        expected["timestamp"] = ANY  # Tested separately
+        )
         log_size = ANY  # Tested separately
 
         mock_log_worker().enqueue.assert_called_once_with(expected, log_size)
 
     @pytest.mark.parametrize("with_context", [True, False])
     def test_respects_explicit_flow_run_id(
-        self, logger, mock_log_worker, flow_run, with_context
+        self, logger, mock_log_worker, flow_run, with_context, expected_log
     ):
         flow_run_id = uuid.uuid4()
         context = (
@@ -385,21 +449,20 @@ class TestAPILogHandler:
         with context:
             logger.info("test-task", extra={"flow_run_id": flow_run_id})
 
-        expected = LogCreate.construct(
+        expected = expected_log(
             flow_run_id=flow_run_id,
             task_run_id=None,
             name=logger.name,
             level=logging.INFO,
             message="test-task",
-        ).dict(json_compatible=True)
-        expected["timestamp"] = ANY  # Tested separately
+        )
         log_size = ANY  # Tested separately
 
         mock_log_worker().enqueue.assert_called_once_with(expected, log_size)
 
     @pytest.mark.parametrize("with_context", [True, False])
     def test_respects_explicit_task_run_id(
-        self, logger, mock_log_worker, flow_run, with_context, task_run
+        self, logger, mock_log_worker, flow_run, with_context, task_run, expected_log
     ):
         task_run_id = uuid.uuid4()
         context = (
@@ -411,14 +474,13 @@ class TestAPILogHandler:
             with context:
                 logger.warning("test-task", extra={"task_run_id": task_run_id})
 
-        expected = LogCreate.construct(
+        expected = expected_log(
             flow_run_id=flow_run.id,
             task_run_id=task_run_id,
             name=logger.name,
             level=logging.WARNING,
             message="test-task",
-        ).dict(json_compatible=True)
-        expected["timestamp"] = ANY  # Tested separately
+        )
         log_size = ANY  # Tested separately
 
         mock_log_worker().enqueue.assert_called_once_with(expected, log_size)
@@ -440,15 +502,12 @@ class TestAPILogHandler:
         mock_log_worker().enqueue.assert_not_called()
 
     def test_sets_timestamp_from_record_created_time(
-        self, logger, mock_log_worker, flow_run, handler
+        self, logger, mock_log_worker, flow_run, emitted_records
     ):
-        # Capture the record
-        handler.emit = MagicMock(side_effect=handler.emit)
-
         with FlowRunContext.construct(flow_run=flow_run):
             logger.info("test-flow")
 
-        record = handler.emit.call_args[0][0]
+        record = emitted_records[-1]
         log_dict = mock_log_worker().enqueue.call_args[0][0]
 
         assert (
@@ -482,6 +541,14 @@ class TestAPILogHandler:
 
         mock_log_worker().enqueue.assert_not_called()
 
+    def test_does_not_emit_logs_that_opt_out(self, logger, handler, task_run):
+        handler.emit = MagicMock()
+
+        with TaskRunContext.construct(task_run=task_run):
+            logger.info("test", extra={"send_to_orion": False})
+
+        handler.emit.assert_not_called()
+
     def test_does_not_send_logs_when_handler_is_disabled(
         self, logger, mock_log_worker, task_run
     ):
@@ -591,6 +658,15 @@ class TestAPILogHandler:
         output = capsys.readouterr()
         assert "RuntimeError: Oh no!" in output.err
 
+    def test_does_not_enqueue_logs_with_invalid_run_ids(
+        self, logger, mock_log_worker, capsys
+    ):
+        logger.info("test", extra={"flow_run_id": "not-a-uuid"})
+
+        mock_log_worker().enqueue.assert_not_called()
+        output = capsys.readouterr()
+        assert "ValueError" in output.err
+
     def test_does_not_write_error_for_logs_outside_run_context_that_opt_out(
         self, logger, mock_log_worker, capsys
     ):
@@ -630,6 +706,12 @@ class TestAPILogHandler:
         handler = APILogHandler()
         assert handler.get_log_size(dict_log) == log_size
 
+    def test_handler_counts_non_ascii_log_size_in_bytes(self):
+        dict_log = {"message": "héllo wörld 👋"}
+
+        handler = APILogHandler()
+        assert handler.get_log_size(dict_log) == len(json.dumps(dict_log).encode())
+
 
 class TestAPILogWorker:
     @pytest.fixture
@@ -693,7 +775,7 @@ class TestAPILogWorker:
 
     def test_enqueue(self, log_dict, log_size, worker):
         worker.enqueue(log_dict, log_size)
-        assert worker._queue.get_nowait() == (log_dict, log_size)
+        assert worker._queue.popleft() == (log_dict, log_size)
 
     async def test_send_logs_single_record(
         self, log_dict, log_size, orion_client, worker
@@ -741,8 +823,7 @@ class TestAPILogWorker:
 
         # Log moved from queue to pending logs
         assert worker._pending_logs == [log_dict]
-        with pytest.raises(queue.Empty):
-            worker._queue.get_nowait()
+        assert not worker._queue
 
         # Restore client
         monkeypatch.setattr(
@@ -796,6 +877,69 @@ class TestAPILogWorker:
 
         assert mock_create_logs.call_count == 3
 
+    async def test_send_logs_retains_failed_batches_in_order(
+        self, log_dict, log_size, monkeypatch, get_worker
+    ):
+        logs = [{**log_dict, "message": str(i)} for i in range(4)]
+        failing = {"1", "3"}
+
+        async def create_logs(self, batch):
+            if batch[0]["message"] in failing:
+                raise ValueError("Test")
+
+        monkeypatch.setattr("prefect.client.PrefectClient.create_logs", create_logs)
+
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_BATCH_SIZE: log_size + 1,
+                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: log_size,
+            }
+        ):
+            worker = get_worker()
+            for log in logs:
+                worker.enqueue(log, log_size)
+            await worker.send_logs()
+
+            # The first failed batch is pending and later failures are requeued
+            assert worker._pending_logs == [logs[1]]
+            assert worker._pending_size == log_size
+            assert list(worker._queue) == [(logs[3], log_size)]
+            assert worker._retries == 1
+
+            # The pending batch recovers; the retry count restarts for the batch
+            # that replaces it
+            failing.discard("1")
+            await worker.send_logs()
+
+        assert worker._pending_logs == [logs[3]]
+        assert not worker._queue
+        assert worker._retries == 1
+
+    async def test_send_logs_uses_one_client_for_all_batches(
+        self, log_dict, log_size, monkeypatch, get_worker
+    ):
+        mock_create_logs = AsyncMock()
+        monkeypatch.setattr(
+            "prefect.client.PrefectClient.create_logs", mock_create_logs
+        )
+        mock_get_client = MagicMock(side_effect=prefect.client.orchestration.get_client)
+        monkeypatch.setattr("prefect.logging.handlers.get_client", mock_get_client)
+
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_BATCH_SIZE: log_size + 1,
+                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: log_size,
+            }
+        ):
+            worker = get_worker()
+            worker.enqueue(log_dict, log_size)
+            worker.enqueue(log_dict, log_size)
+            worker.enqueue(log_dict, log_size)
+            await worker.send_logs()
+
+        assert mock_create_logs.call_count == 3
+        mock_get_client.assert_called_once()
+
     @pytest.mark.flaky(max_runs=3)
     async def test_logs_are_sent_when_started(
         self, log_dict, log_size, orion_client, get_worker, monkeypatch
@@ -836,6 +980,39 @@ class TestAPILogWorker:
 
         worker._flush_event.wait.assert_called_with(5)
 
+    def test_worker_is_woken_when_a_full_batch_is_enqueued(
+        self, log_dict, log_size, get_worker
+    ):
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_BATCH_SIZE: log_size * 2,
+                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: log_size,
+            }
+        ):
+            worker = get_worker()
+
+        worker.enqueue(log_dict, log_size)
+        assert not worker._flush_event.is_set()
+
+        worker.enqueue(log_dict, log_size)
+        assert worker._flush_event.is_set()
+
+    def test_worker_is_not_woken_early_while_logs_are_pending_retry(
+        self, log_dict, log_size, get_worker
+    ):
+        with temporary_settings(
+            updates={
+                PREFECT_LOGGING_TO_API_BATCH_SIZE: log_size * 2,
+                PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: log_size,
+            }
+        ):
+            worker = get_worker()
+
+        worker._pending_logs = [log_dict]
+        worker.enqueue(log_dict, log_size)
+        worker.enqueue(log_dict, log_size)
+        assert not worker._flush_event.is_set()
+
     def test_flush_event_is_cleared(self, get_worker):
         with temporary_settings(updates={PREFECT_LOGGING_TO_API_BATCH_INTERVAL: "5"}):
             worker = get_worker()
@@ -1068,6 +1245,37 @@ async def test_run_logger_in_flow(orion_client):
     }
 
 
+def test_run_logger_adapter_merges_extra_data(caplog):
+    adapter = PrefectLogAdapter(get_logger("test"), extra={"foo": "a", "bar": "b"})
+
+    adapter.info("without extra")
+    adapter.info("with extra", extra={"bar": "c"})
+
+    without_extra, with_extra = caplog.records[-2:]
+    assert (without_extra.foo, without_extra.bar) == ("a", "b")
+    assert (with_extra.foo, with_extra.bar) == ("a", "c")
+    assert adapter.extra == {"foo": "a", "bar": "b"}
+
+
+def test_run_logger_is_reused_within_a_run(flow_run):
+    with FlowRunContext.construct(flow_run=flow_run, flow=None):
+        logger = get_run_logger()
+        assert get_run_logger() is logger
+        assert get_run_logger(foo="test") is not logger
+
+
+def test_run_logger_is_not_reused_after_run_is_renamed():
+    flow_run = prefect.client.schemas.FlowRun(flow_id=uuid.uuid4(), name="original")
+
+    with FlowRunContext.construct(flow_run=flow_run, flow=None):
+        logger = get_run_logger()
+        flow_run.name = "renamed"
+        renamed_logger = get_run_logger()
+
+    assert renamed_logger is not logger
+    assert renamed_logger.extra["flow_run_name"] == "renamed"
+
+
 async def test_run_logger_extra_data(orion_client):
     @flow
     def test_flow():
@@ -1172,6 +1380,18 @@ class TestPrefectConsoleHandler:
         ]
         assert handler.level == logging.DEBUG
 
+    def test_init_level_name(self, capsys):
+        handler = PrefectConsoleHandler(level="WARNING")
+        assert handler.level == logging.WARNING
+
+        logger = get_logger(uuid.uuid4().hex)
+        logger.handlers = [handler]
+        logger.info("Hidden")
+        logger.warning("Shown")
+        _, stderr = capsys.readouterr()
+        assert "Hidden" not in stderr
+        assert "Shown" in stderr
+
     def test_uses_stderr_by_default(self, capsys):
         logger = get_logger(uuid.uuid4().hex)
         logger.handlers = [PrefectConsoleHandler()]
@@ -1227,6 +1447,20 @@ class TestPrefectConsoleHandler:
         _, stderr = capsys.readouterr()
         assert msg in stderr
 
+    def test_writes_plain_text_without_rich_when_unstyled(self, capsys):
+        with temporary_settings({PREFECT_LOGGING_COLORS: False}):
+            logger = get_logger(uuid.uuid4().hex)
+            handler = PrefectConsoleHandler()
+            handler.console.print = MagicMock()
+            logger.handlers = [handler]
+
+            msg = "DROP TABLE [dbo].[SomeTable];"
+            logger.info(msg)
+
+        handler.console.print.assert_not_called()
+        _, stderr = capsys.readouterr()
+        assert stderr == msg + "\n"
+
     def test_outputs_square_brackets_as_style(self, capsys):
         with temporary_settings({PREFECT_LOGGING_MARKUP: True}):
             logger = get_logger(uuid.uuid4().hex)
@@ -1265,6 +1499,23 @@ class TestJsonFormatter:
         assert deserialized["filename"] == "file.py"
         assert deserialized["lineno"] == 1
 
+    def test_json_log_formatter_pretty(self):
+        formatter = JsonFormatter("pretty", None, "%")
+        record = logging.LogRecord(
+            name="Test Log",
+            level=1,
+            pathname="/path/file.py",
+            lineno=1,
+            msg="log message",
+            args=None,
+            exc_info=None,
+        )
+
+        formatted = formatter.format(record)
+
+        assert formatted.startswith('{\n  "name": "Test Log",')
+        assert json.loads(formatted)["msg"] == "log message"
+
     def test_json_log_formatter_with_exception(self):
         exc_info = None
         try: